@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+
+from truststack_grc.config import get_settings
+from truststack_grc.core.projects import service
+from truststack_grc.core.projects.service import (
+    _hash_checklist,
+    _load_pack_cached,
+    _normalize_selected_llms,
+    _packs_hash,
+    _slug,
+    _taxonomy_hash_cached,
+)
+from truststack_grc.core.storage.filesystem import FileSystemStorage, StoragePaths
+from truststack_grc.core.taxonomy.loader import TaxonomyLoader, TaxonomyPaths
+from truststack_grc.core.util.yamlio import write_yaml
+
+def test_slug_collapses_non_alnum_runs():
+    assert _slug("  Claims Assistant -- Pilot!! ") == "claims-assistant-pilot"
+    assert _slug("Zoë – 北京 42") == "zo-42"
+
+def test_slug_falls_back_when_empty():
+    assert _slug(" !!! ") == "project"
+
+def test_hash_checklist_depends_on_field_boundaries():
+    a = [{"merge_key": "k", "severity": "high", "title": "ab"}]
+    b = [{"merge_key": "k", "severity": "higha", "title": "b"}]
+    assert _hash_checklist(a) == _hash_checklist([dict(a[0])])
+    assert _hash_checklist(a) != _hash_checklist(b)
+
+def test_normalize_selected_llms_dedups_case_insensitively():
+    assert _normalize_selected_llms([" GPT-4o ", "gpt-4o", "  ", "Claude"]) == ["GPT-4o", "Claude"]
+    assert _normalize_selected_llms(None) == []
+
+def test_empty_hashes_match_streamed_digest():
+    assert _hash_checklist([]) == hashlib.sha256().hexdigest()
+    assert _packs_hash([]) == hashlib.sha256().hexdigest()
+
+def test_taxonomy_hash_follows_edits_on_disk(tmp_path):
+    industry_file = tmp_path / "industries" / "finance" / "industry.yaml"
+    write_yaml(industry_file, {"id": "finance", "name": "Finance"})
+    taxonomy = TaxonomyLoader(
+        paths=TaxonomyPaths(root=tmp_path, industries_dir=tmp_path / "industries"),
+        schema_dir=get_settings().config_root.parent / "schemas",
+    )
+    first = _taxonomy_hash_cached(taxonomy)
+    assert _taxonomy_hash_cached(taxonomy) == first
+
+    write_yaml(industry_file, {"id": "finance", "name": "Edited Finance"})
+    st = industry_file.stat()
+    os.utime(industry_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _taxonomy_hash_cached(taxonomy) != first
+
+def test_load_pack_cache_does_not_remember_misses(monkeypatch):
+    class Registry:
+        def __init__(self):
+            self.available = {}
+            self.calls = 0
+
+        def load_pack(self, domain, pack_id, version):
+            self.calls += 1
+            return self.available.get((domain, pack_id, version))
+
+    registry = Registry()
+    service.clear_caches()
+    monkeypatch.setattr(service, "_pack_registry", lambda: registry)
+    try:
+        assert _load_pack_cached("security", "owasp-llm-top10", "9.9") is None
+        pack = object()
+        registry.available[("security", "owasp-llm-top10", "9.9")] = pack
+        assert _load_pack_cached("security", "owasp-llm-top10", "9.9") is pack
+        assert _load_pack_cached("security", "owasp-llm-top10", "9.9") is pack
+        assert registry.calls == 2
+    finally:
+        monkeypatch.undo()
+        service.clear_caches()
+
+OWASP = {"domain": "security", "pack_id": "owasp-llm-top10", "version": "1.1"}
+NIST = {"domain": "governance", "pack_id": "nist-ai-rmf", "version": "1.0"}
+
+def _create(tmp_path, selected_packs):
+    svc = service.ProjectService(storage=FileSystemStorage(StoragePaths(workspace_root=tmp_path)))
+    created = svc.create_project(
+        {
+            "name": "Fraud Pilot",
+            "industry_id": "finance",
+            "segment_id": "banking",
+            "use_case_id": "fraud-detection",
+            "deployment_environment": "AWS Native",
+            "selected_llms": ["GPT-4o"],
+            "selected_packs": selected_packs,
+        },
+        actor="alice",
+    )
+    return svc, created["project_id"]
+
+def _snapshot(svc, project_id):
+    d = svc.storage.project_dir(project_id)
+    return {name: (d / name).read_bytes() for name in ("project.yaml", "checklist.yaml", "auditlog.ndjson")}
+
+def _audit(svc, project_id):
+    return [json.loads(line) for line in svc.storage.audit_path(project_id).read_text(encoding="utf-8").splitlines()]
+
+def test_update_project_noop_patch_writes_nothing(tmp_path):
+    svc, pid = _create(tmp_path, [OWASP])
+    before = _snapshot(svc, pid)
+    proj = svc.update_project(pid, {"name": "Fraud Pilot", "deployment_environment": "AWS Native", "selected_llms": [" GPT-4o "]}, actor="bob")
+    assert proj["project"]["name"] == "Fraud Pilot"
+    assert _snapshot(svc, pid) == before
+
+def test_update_project_audits_only_changed_fields(tmp_path):
+    svc, pid = _create(tmp_path, [OWASP])
+    created_at = svc.storage.read_project(pid)["project"]["updated_at"]
+    svc.update_project(pid, {"name": "Fraud Pilot", "selected_llms": ["Claude"]}, actor="bob")
+    event = _audit(svc, pid)[-1]
+    assert event["event_type"] == "project.updated"
+    assert event["details"] == {
+        "before": {"selected_llms": ["GPT-4o"]},
+        "after": {"selected_llms": ["Claude"]},
+        "checklist_regenerated": False,
+    }
+    assert svc.storage.read_project(pid)["project"]["updated_at"] > created_at
+
+def test_update_project_same_packs_skips_regeneration(tmp_path):
+    svc, pid = _create(tmp_path, [OWASP, NIST])
+    checklist_before = _snapshot(svc, pid)["checklist.yaml"]
+    svc.update_project(pid, {"name": "Renamed", "selected_packs": [dict(OWASP), dict(NIST)]}, actor="bob")
+    assert _snapshot(svc, pid)["checklist.yaml"] == checklist_before
+    details = _audit(svc, pid)[-1]["details"]
+    assert details["checklist_regenerated"] is False
+    assert list(details["after"]) == ["name"]
+
+def test_update_project_reordered_packs_regenerate(tmp_path):
+    svc, pid = _create(tmp_path, [OWASP, NIST])
+    svc.update_project(pid, {"selected_packs": [NIST, OWASP]}, actor="bob")
+    details = _audit(svc, pid)[-1]["details"]
+    assert details["checklist_regenerated"] is True
+    assert details["after"]["selected_packs"] == [NIST, OWASP]
+    assert svc.storage.read_project(pid)["inputs"]["selected_packs"] == [NIST, OWASP]
+
+def test_update_checklist_item_noop_patch_writes_nothing(tmp_path):
+    svc, pid = _create(tmp_path, [OWASP])
+    item = svc.storage.read_checklist(pid)["items"][0]
+    before = _snapshot(svc, pid)
+    found = svc.update_checklist_item(pid, item["item_id"], {"status": item["status"]}, actor="bob")
+    assert found["status"] == item["status"]
+    assert _snapshot(svc, pid) == before
@@ -0,0 +1,63 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from truststack_grc.core.storage.filesystem import FileSystemStorage, StoragePaths
+from truststack_grc.core.util.yamlio import write_yaml
+
+def _storage(tmp_path):
+    return FileSystemStorage(StoragePaths(workspace_root=tmp_path))
+
+def test_read_checklist_returns_private_copies(tmp_path):
+    storage = _storage(tmp_path)
+    storage.write_checklist("p", {"items": [{"item_id": "a", "status": "not_started"}]})
+    checklist, index = storage.read_checklist_indexed("p")
+    checklist["items"][index["a"]]["status"] = "implemented"
+    assert storage.read_checklist("p")["items"][0]["status"] == "not_started"
+
+def test_read_checklist_sees_external_edits(tmp_path):
+    storage = _storage(tmp_path)
+    storage.write_checklist("p", {"items": [{"item_id": "a"}]})
+    assert storage.read_checklist("p")["items"] == [{"item_id": "a"}]
+    write_yaml(storage.project_dir("p") / "checklist.yaml", {"items": [{"item_id": "a"}, {"item_id": "b"}]})
+    _, index = storage.read_checklist_indexed("p")
+    assert index == {"a": 0, "b": 1}
+
+class _Reader:
+    def __init__(self, data, fail_after=None):
+        self.data = data
+        self.pos = 0
+        self.reads = 0
+        self.fail_after = fail_after
+
+    async def read(self, n=-1):
+        if self.fail_after is not None and self.reads >= self.fail_after:
+            raise OSError("connection reset")
+        self.reads += 1
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += len(chunk)
+        return chunk
+
+def test_save_evidence_stream_hashes_in_chunks(tmp_path):
+    storage = _storage(tmp_path)
+    data = bytes(range(256)) * 40
+    reader = _Reader(data)
+    meta = asyncio.run(storage.save_evidence_stream("p", "item", "report.pdf", reader, chunk_size=1000))
+    assert meta["bytes"] == len(data)
+    assert meta["sha256"] == hashlib.sha256(data).hexdigest()
+    assert meta["relative_path"] == "evidence/item/report.pdf"
+    assert reader.reads == 12  # 11 chunks plus the empty read that ends the stream
+    assert (storage.project_dir("p") / meta["relative_path"]).read_bytes() == data
+
+def test_save_evidence_stream_removes_partial_file(tmp_path):
+    storage = _storage(tmp_path)
+    with pytest.raises(OSError):
+        asyncio.run(storage.save_evidence_stream("p", "item", "report.pdf", _Reader(b"x" * 5000, fail_after=2), chunk_size=1000))
+    assert list((storage.project_dir("p") / "evidence" / "item").iterdir()) == []
+
+def test_checklist_index_keeps_first_duplicate(tmp_path):
+    storage = _storage(tmp_path)
+    storage.write_checklist("p", {"items": [{"item_id": "a"}, {"item_id": "b"}, {"item_id": "a"}]})
+    _, index = storage.read_checklist_indexed("p")
+    assert index == {"a": 0, "b": 1}
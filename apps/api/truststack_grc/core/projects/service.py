@@ -1,47 +1,166 @@
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from truststack_grc.config import get_settings
 from truststack_grc.core.mapping.engine import generate_checklist, summarize
 from truststack_grc.core.packs.loader import PackRegistry
+from truststack_grc.core.packs.models import Pack
+from truststack_grc.core.storage.auditlog import AuditEvent
 from truststack_grc.core.storage.filesystem import FileSystemStorage
 from truststack_grc.core.storage.hashing import sha256_text
 from truststack_grc.core.taxonomy.loader import TaxonomyLoader
 from truststack_grc.core.projects.context import build_context
 
-ALLOWED_DEPLOYMENT_ENVIRONMENTS = {"AWS Native", "GCP Native", "Azure Native", "Custom Stack"}
+ALLOWED_DEPLOYMENT_ENVIRONMENTS: frozenset[str] = frozenset({"AWS Native", "GCP Native", "Azure Native", "Custom Stack"})
+
+class _SlugTable(dict):
+    # Anything outside Latin-1 is never [a-z0-9], so map it to a dash too.
+    def __missing__(self, codepoint: int) -> str:
+        return "-"
+
+_SLUG_TABLE = _SlugTable(
+    {c: chr(c) if "a" <= chr(c) <= "z" or "0" <= chr(c) <= "9" else "-" for c in range(256)}
+)
 
 def _slug(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = s.strip().lower().translate(_SLUG_TABLE)
+    # Collapse dash runs and trim the ends in one pass.
+    s = "-".join(part for part in s.split("-") if part)
     return s or "project"
 
+@lru_cache(maxsize=1)
+def _taxonomy_cached() -> TaxonomyLoader:
+    return TaxonomyLoader.from_env()
+
+def _taxonomy_stamp(taxonomy: TaxonomyLoader) -> tuple[int, int]:
+    # (entry count, newest mtime) over every file and folder in the taxonomy tree. Edits bump a
+    # file's mtime; adds, removes and renames bump the parent folder's.
+    root = taxonomy.paths.industries_dir
+    if not root.exists():
+        return 0, 0
+    count = 0
+    newest = root.stat().st_mtime_ns
+    for p in root.rglob("*"):
+        count += 1
+        newest = max(newest, p.stat().st_mtime_ns)
+    return count, newest
+
+@lru_cache(maxsize=1)
+def _taxonomy_hash_for(taxonomy: TaxonomyLoader, stamp: tuple[int, int]) -> str:
+    # Canonical JSON rather than repr(): C-encoded and stable across Python versions.
+    preimage = json.dumps(taxonomy.list_industries(), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return sha256_text(preimage)
+
+def _taxonomy_hash_cached(taxonomy: TaxonomyLoader) -> str:
+    # list_industries() re-reads YAML on every call, so the memo must follow the files on disk
+    # (registry/ is a live volume in docker-compose). A stat walk is far cheaper than the parse.
+    return _taxonomy_hash_for(taxonomy, _taxonomy_stamp(taxonomy))
+
+_PACK_LOAD_WORKERS = 8
+
+@lru_cache(maxsize=1)
+def _pack_registry() -> PackRegistry:
+    return PackRegistry.from_env()
+
+# Pack versions are immutable folders, so (domain, pack_id, version) identifies the content of a
+# pack that exists. Misses are never cached: that version may be added while the process runs.
+_PACK_CACHE_SIZE = 512
+_PACK_CACHE: dict[tuple[str, str, str], Pack] = {}
+_PACK_CACHE_LOCK = threading.Lock()
+
+def _load_pack_cached(domain: str, pack_id: str, version: str) -> Pack | None:
+    key = (domain, pack_id, version)
+    pack = _PACK_CACHE.get(key)
+    if pack is not None:
+        return pack
+    pack = _pack_registry().load_pack(domain=domain, pack_id=pack_id, version=version)
+    if pack is not None:
+        with _PACK_CACHE_LOCK:
+            if key not in _PACK_CACHE and len(_PACK_CACHE) >= _PACK_CACHE_SIZE:
+                del _PACK_CACHE[next(iter(_PACK_CACHE))]
+            _PACK_CACHE[key] = pack
+    return pack
+
+# Call after editing registry/ in a running process so the next request re-reads it.
+def clear_caches() -> None:
+    _taxonomy_cached.cache_clear()
+    _taxonomy_hash_for.cache_clear()
+    _pack_registry.cache_clear()
+    with _PACK_CACHE_LOCK:
+        _PACK_CACHE.clear()
+
+# Digest of an empty preimage, which is what both hashers below produce for an empty list.
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+def _hash_checklist(items: list[dict[str, Any]]) -> str:
+    # Stream fields into the hasher (unit/record separators) instead of hashing a repr() of the list.
+    if not items:
+        return _EMPTY_SHA256
+    h = hashlib.sha256()
+    for i in items:
+        h.update(i["merge_key"].encode("utf-8"))
+        h.update(b"\x1f")
+        h.update(i["severity"].encode("utf-8"))
+        h.update(b"\x1f")
+        h.update(i["title"].encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+def _packs_hash(packs: list[Pack]) -> str:
+    # Same preimage as the old "|".join(f"{domain}:{id}:{version}:{hash}"), without building it.
+    if not packs:
+        return _EMPTY_SHA256
+    h = hashlib.sha256()
+    for i, p in enumerate(packs):
+        if i:
+            h.update(b"|")
+        h.update(p.pack.domain.encode("utf-8"))
+        h.update(b":")
+        h.update(p.pack.id.encode("utf-8"))
+        h.update(b":")
+        h.update(p.pack.version.encode("utf-8"))
+        h.update(b":")
+        h.update(p.hash.encode("utf-8"))
+    return h.hexdigest()
+
+def _audited_fields(proj: dict[str, Any]) -> dict[str, Any]:
+    project = proj.get("project", {})
+    inputs = proj.get("inputs", {})
+    return {
+        "name": project.get("name"),
+        "description": project.get("description"),
+        "deployment_environment": inputs.get("deployment_environment"),
+        "selected_llms": inputs.get("selected_llms", []),
+        "selected_packs": inputs.get("selected_packs", []),
+    }
+
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def _normalize_selected_llms(selected_llms: list[Any] | None) -> list[str]:
     if not selected_llms:
         return []
-    normalized: list[str] = []
-    seen: set[str] = set()
+    # Case-insensitive dedup keeping the first spelling; dicts preserve insertion order.
+    normalized: dict[str, str] = {}
     for llm in selected_llms:
         text = str(llm).strip()
-        if not text:
-            continue
-        key = text.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        normalized.append(text)
-    return normalized
+        if text:
+            normalized.setdefault(text.lower(), text)
+    return list(normalized.values())
 
 def _normalize_deployment_environment(value: Any) -> str | None:
     if value is None:
         return None
+    # Requests validated by the API already carry the canonical string.
+    if isinstance(value, str) and value in ALLOWED_DEPLOYMENT_ENVIRONMENTS:
+        return value
     text = str(value).strip()
     if not text:
         return None
@@ -55,7 +174,7 @@ class ProjectService:
         self.settings = get_settings()
 
     def create_project(self, req: dict[str, Any], actor: str) -> dict[str, Any]:
-        taxonomy = TaxonomyLoader.from_env()
+        taxonomy = _taxonomy_cached()
         uc = taxonomy.get_use_case(req["use_case_id"])
         if not uc:
             raise ValueError("Unknown use case")
@@ -80,20 +199,22 @@ class ProjectService:
 
         checklist = generate_checklist(context=context, packs=packs)
 
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        project_id = f"{_slug(req['name'])}-{ts}"
+        # One instant for the id suffix and every timestamp in the new documents.
+        now_dt = datetime.now(timezone.utc)
+        now_iso = now_dt.isoformat()
+        project_id = f"{_slug(req['name'])}-{now_dt.strftime('%Y%m%d-%H%M%S')}"
 
-        taxonomy_hash = sha256_text(str(taxonomy.list_industries()))
-        packs_hash = sha256_text("|".join([f"{p.pack.domain}:{p.pack.id}:{p.pack.version}:{p.hash}" for p in packs]))
-        checklist_hash = sha256_text(str([(i["merge_key"], i["severity"], i["title"]) for i in checklist["items"]]))
+        taxonomy_hash = _taxonomy_hash_cached(taxonomy)
+        packs_hash = _packs_hash(packs)
+        checklist_hash = _hash_checklist(checklist["items"])
 
         project_doc = {
             "project": {
                 "id": project_id,
                 "name": req["name"],
                 "description": req.get("description"),
-                "created_at": utc_now(),
-                "updated_at": utc_now(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
             },
             "inputs": {
                 "industry_id": req["industry_id"],
@@ -115,138 +236,163 @@ class ProjectService:
 
         checklist_doc = {
             "project_id": project_id,
-            "generated_at": utc_now(),
+            "generated_at": now_iso,
             "items": checklist["items"],
             "counts": checklist["counts"],
         }
 
-        self.storage.write_project(project_id, project_doc)
-        self.storage.write_checklist(project_id, checklist_doc)
-        self.storage.append_audit(project_id, "project.created", actor, {"project": {"id": project_id, "name": req["name"]}})
+        self.storage.write_bundle(
+            project_id,
+            project_doc,
+            checklist_doc,
+            AuditEvent(event_type="project.created", actor=actor, details={"project": {"id": project_id, "name": req["name"]}}),
+        )
 
         return {"project": project_doc["project"], "project_id": project_id}
 
     def _load_packs(self, selected_packs: list[dict[str, Any]]) -> tuple[list[Any], list[dict[str, str]]]:
-        reg = PackRegistry.from_env()
-        loaded = []
-        normalized = []
-        for p in selected_packs:
-            entry = {
+        normalized = [
+            {
                 "domain": p["domain"],
                 "pack_id": p["pack_id"],
                 "version": p["version"],
             }
-            pack = reg.load_pack(domain=entry["domain"], pack_id=entry["pack_id"], version=entry["version"])
+            for p in selected_packs
+        ]
+
+        def load(entry: dict[str, str]) -> Pack | None:
+            return _load_pack_cached(entry["domain"], entry["pack_id"], entry["version"])
+
+        # Warm packs come straight from the cache; spinning up a pool for them costs far more
+        # than the lookups. Only cold loads (file reads and directory hashing) go to threads.
+        results: list[Pack | None] = [
+            _PACK_CACHE.get((entry["domain"], entry["pack_id"], entry["version"])) for entry in normalized
+        ]
+        misses = [i for i, pack in enumerate(results) if pack is None]
+        if len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=min(_PACK_LOAD_WORKERS, len(misses))) as ex:
+                for i, pack in zip(misses, ex.map(load, [normalized[i] for i in misses])):
+                    results[i] = pack
+        elif misses:
+            results[misses[0]] = load(normalized[misses[0]])
+
+        loaded = []
+        for entry, pack in zip(normalized, results):
             if not pack:
                 raise ValueError(f"Unknown pack: {entry}")
             loaded.append(pack)
-            normalized.append(entry)
         return loaded, normalized
 
     def update_checklist_item(self, project_id: str, item_id: str, patch: dict[str, Any], actor: str) -> dict[str, Any] | None:
         proj = self.storage.read_project(project_id)
-        checklist = self.storage.read_checklist(project_id)
+        checklist, index = self.storage.read_checklist_indexed(project_id)
         if not proj or not checklist:
             return None
-
-        items = checklist.get("items", [])
-        found = None
-        for it in items:
-            if it.get("item_id") == item_id:
-                found = it
-                break
-        if not found:
+        idx = index.get(item_id)
+        if idx is None:
             return None
+        found = checklist["items"][idx]
 
-        before = {k: found.get(k) for k in ["status", "owner", "notes"]}
-        for k in ["status", "owner", "notes"]:
+        fg = found.get
+        before = {"status": fg("status"), "owner": fg("owner"), "notes": fg("notes")}
+        for k in ("status", "owner", "notes"):
             if k in patch:
                 found[k] = patch[k]
-        after = {k: found.get(k) for k in ["status", "owner", "notes"]}
+        after = {"status": fg("status"), "owner": fg("owner"), "notes": fg("notes")}
+        if after == before:
+            # Nothing changed: skip rewriting both documents and the audit line.
+            return found
 
         proj["project"]["updated_at"] = utc_now()
-        self.storage.write_project(project_id, proj)
-        self.storage.write_checklist(project_id, checklist)
-        self.storage.append_audit(project_id, "checklist.item.updated", actor, {"item_id": item_id, "before": before, "after": after})
+        self.storage.write_bundle(
+            project_id,
+            proj,
+            checklist,
+            AuditEvent(event_type="checklist.item.updated", actor=actor, details={"item_id": item_id, "before": before, "after": after}),
+        )
         return found
 
     def update_project(self, project_id: str, patch: dict[str, Any], actor: str) -> dict[str, Any] | None:
         proj = self.storage.read_project(project_id)
         if not proj:
             return None
+        now_iso = utc_now()
 
-        before = {
-            "name": proj.get("project", {}).get("name"),
-            "description": proj.get("project", {}).get("description"),
-            "deployment_environment": proj.get("inputs", {}).get("deployment_environment"),
-            "selected_llms": proj.get("inputs", {}).get("selected_llms", []),
-            "selected_packs": proj.get("inputs", {}).get("selected_packs", []),
-        }
+        before = _audited_fields(proj)
 
         for key in {"name", "description"}:
             if key in patch:
                 proj["project"][key] = patch[key]
 
         checklist_changed = False
+        checklist_doc = None
         if "deployment_environment" in patch:
             deployment_environment = _normalize_deployment_environment(patch.get("deployment_environment"))
-            proj.setdefault("inputs", {})["deployment_environment"] = deployment_environment
+            if deployment_environment != before["deployment_environment"]:
+                proj.setdefault("inputs", {})["deployment_environment"] = deployment_environment
 
         if "selected_llms" in patch:
             normalized_selected_llms = _normalize_selected_llms(patch.get("selected_llms"))
-            proj.setdefault("inputs", {})["selected_llms"] = normalized_selected_llms
+            if normalized_selected_llms != before["selected_llms"]:
+                proj.setdefault("inputs", {})["selected_llms"] = normalized_selected_llms
 
         if "selected_packs" in patch:
             selected_packs = patch.get("selected_packs") or []
             packs, normalized_selected_packs = self._load_packs(selected_packs)
-            context = proj.get("context", {})
-            regenerated = generate_checklist(context=context, packs=packs)
-
-            prior = self.storage.read_checklist(project_id) or {}
-            prior_items = {it.get("item_id"): it for it in prior.get("items", [])}
-            for item in regenerated["items"]:
-                previous = prior_items.get(item.get("item_id"))
-                if not previous:
-                    continue
-                for k in ["status", "owner", "notes", "evidence"]:
-                    item[k] = previous.get(k)
-
-            regenerated["counts"] = summarize(regenerated["items"])
-
-            proj.setdefault("inputs", {})["selected_packs"] = normalized_selected_packs
-            taxonomy = TaxonomyLoader.from_env()
-            proj.setdefault("generated", {})["taxonomy_hash"] = sha256_text(str(taxonomy.list_industries()))
-            proj["generated"]["packs_hash"] = sha256_text(
-                "|".join([f"{p.pack.domain}:{p.pack.id}:{p.pack.version}:{p.hash}" for p in packs])
-            )
-            proj["generated"]["checklist_hash"] = sha256_text(
-                str([(i["merge_key"], i["severity"], i["title"]) for i in regenerated["items"]])
-            )
-
-            checklist_doc = {
-                "project_id": project_id,
-                "generated_at": utc_now(),
-                "items": regenerated["items"],
-                "counts": regenerated["counts"],
-            }
-            self.storage.write_checklist(project_id, checklist_doc)
-            checklist_changed = True
-
-        proj["project"]["updated_at"] = utc_now()
-        after = {
-            "name": proj.get("project", {}).get("name"),
-            "description": proj.get("project", {}).get("description"),
-            "deployment_environment": proj.get("inputs", {}).get("deployment_environment"),
-            "selected_llms": proj.get("inputs", {}).get("selected_llms", []),
-            "selected_packs": proj.get("inputs", {}).get("selected_packs", []),
-        }
-
-        self.storage.write_project(project_id, proj)
-        self.storage.append_audit(
+            # Idempotent PUTs resend the same packs; skip regeneration then. Order is compared as-is
+            # because the first pack of a merged control supplies its title and objective.
+            if normalized_selected_packs != before["selected_packs"]:
+                context = proj.get("context", {})
+                regenerated = generate_checklist(context=context, packs=packs)
+
+                prior = self.storage.read_checklist(project_id) or {}
+                prior_items = {it["item_id"]: it for it in prior.get("items", ()) if it.get("item_id")}
+                for item in regenerated["items"]:
+                    previous = prior_items.get(item["item_id"])
+                    if not previous:
+                        continue
+                    pg = previous.get
+                    item["status"] = pg("status")
+                    item["owner"] = pg("owner")
+                    item["notes"] = pg("notes")
+                    item["evidence"] = pg("evidence")
+
+                regenerated["counts"] = summarize(regenerated["items"])
+
+                proj.setdefault("inputs", {})["selected_packs"] = normalized_selected_packs
+                proj.setdefault("generated", {})["taxonomy_hash"] = _taxonomy_hash_cached(_taxonomy_cached())
+                proj["generated"]["packs_hash"] = _packs_hash(packs)
+                proj["generated"]["checklist_hash"] = _hash_checklist(regenerated["items"])
+
+                checklist_doc = {
+                    "project_id": project_id,
+                    "generated_at": now_iso,
+                    "items": regenerated["items"],
+                    "counts": regenerated["counts"],
+                }
+                checklist_changed = True
+
+        after = _audited_fields(proj)
+        # The audit entry records only the fields that actually changed. A PATCH that changes
+        # nothing writes nothing; a checklist regeneration always changes selected_packs.
+        changed = [k for k in after if after[k] != before[k]]
+        if not changed:
+            return proj
+
+        proj["project"]["updated_at"] = now_iso
+        self.storage.write_bundle(
             project_id,
-            "project.updated",
-            actor,
-            {"before": before, "after": after, "checklist_regenerated": checklist_changed},
+            proj,
+            checklist_doc,
+            AuditEvent(
+                event_type="project.updated",
+                actor=actor,
+                details={
+                    "before": {k: before[k] for k in changed},
+                    "after": {k: after[k] for k in changed},
+                    "checklist_regenerated": checklist_changed,
+                },
+            ),
         )
         return proj
 
@@ -267,28 +413,27 @@ class ProjectService:
 
     async def add_evidence(self, project_id: str, item_id: str, upload_file, actor: str) -> dict[str, Any] | None:
         proj = self.storage.read_project(project_id)
-        checklist = self.storage.read_checklist(project_id)
+        checklist, index = self.storage.read_checklist_indexed(project_id)
         if not proj or not checklist:
             return None
-        items = checklist.get("items", [])
-        found = None
-        for it in items:
-            if it.get("item_id") == item_id:
-                found = it
-                break
-        if not found:
+        idx = index.get(item_id)
+        if idx is None:
             return None
+        found = checklist["items"][idx]
 
-        content = await upload_file.read()
-        meta = self.storage.save_evidence_file(project_id, item_id, upload_file.filename or "upload.bin", content)
+        meta = await self.storage.save_evidence_stream(project_id, item_id, upload_file.filename or "upload.bin", upload_file)
+        now_iso = utc_now()
         meta.update({
             "content_type": upload_file.content_type,
-            "uploaded_at": utc_now(),
+            "uploaded_at": now_iso,
         })
         found.setdefault("evidence", []).append(meta)
 
-        proj["project"]["updated_at"] = utc_now()
-        self.storage.write_project(project_id, proj)
-        self.storage.write_checklist(project_id, checklist)
-        self.storage.append_audit(project_id, "evidence.uploaded", actor, {"item_id": item_id, "file": meta})
+        proj["project"]["updated_at"] = now_iso
+        self.storage.write_bundle(
+            project_id,
+            proj,
+            checklist,
+            AuditEvent(event_type="evidence.uploaded", actor=actor, details={"item_id": item_id, "file": meta}),
+        )
         return meta
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,13 +16,26 @@ class AuditEvent:
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
 def append_event(path: Path, event: AuditEvent) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     record = {
         "ts": utc_now_iso(),
         "event_type": event.event_type,
         "actor": event.actor,
         "details": event.details,
     }
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    try:
+        fd = os.open(path, _APPEND_FLAGS, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, _APPEND_FLAGS, 0o666)
+    # One write() per event: with O_APPEND the whole line lands at the end of the log even if
+    # another writer is appending, where a buffered text file may split long lines.
+    try:
+        view = memoryview(line)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
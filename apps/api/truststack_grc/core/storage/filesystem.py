@@ -1,20 +1,56 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 import shutil
+import threading
 from typing import Any
 
 from truststack_grc.config import get_settings
 from truststack_grc.core.util.yamlio import read_yaml, write_yaml
 from truststack_grc.core.storage.auditlog import append_event, AuditEvent
-from truststack_grc.core.storage.hashing import sha256_file
 
 def safe_filename(name: str) -> str:
     name = name.strip().replace("\\", "_").replace("/", "_")
     name = "".join(ch for ch in name if ch.isalnum() or ch in {"-", "_", ".", " "}).strip()
     return name[:120] or "upload.bin"
 
+# Storage objects are created per request, so write locks live at module scope. A fixed pool of
+# striped locks keeps memory bounded no matter how many projects are touched.
+_PROJECT_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+def _project_lock(project_id: str) -> threading.Lock:
+    return _PROJECT_LOCKS[hash(project_id) % len(_PROJECT_LOCKS)]
+
+# Parsed checklists keyed by file path and validated against (mtime_ns, size), so repeat reads of
+# an unchanged checklist skip the YAML parse. Entries are shared; callers only ever get copies.
+_CHECKLIST_CACHE_SIZE = 32
+_CHECKLIST_CACHE: OrderedDict[str, tuple[tuple[int, int], dict[str, Any], dict[str, int]]] = OrderedDict()
+_CHECKLIST_CACHE_LOCK = threading.Lock()
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+def _index_items(checklist: dict[str, Any]) -> dict[str, int]:
+    # First occurrence wins, like the linear scan this replaced, for hand-edited duplicate ids.
+    index: dict[str, int] = {}
+    for idx, it in enumerate(checklist.get("items", [])):
+        index.setdefault(it.get("item_id"), idx)
+    return index
+
+def _cache_checklist(key: str, stamp: tuple[int, int], checklist: dict[str, Any]) -> tuple[dict[str, Any], dict[str, int]]:
+    entry = (stamp, checklist, _index_items(checklist))
+    with _CHECKLIST_CACHE_LOCK:
+        _CHECKLIST_CACHE[key] = entry
+        _CHECKLIST_CACHE.move_to_end(key)
+        while len(_CHECKLIST_CACHE) > _CHECKLIST_CACHE_SIZE:
+            _CHECKLIST_CACHE.popitem(last=False)
+    return entry[1], entry[2]
+
 @dataclass(frozen=True)
 class StoragePaths:
     workspace_root: Path
@@ -53,29 +89,74 @@ class FileSystemStorage:
     def write_project(self, project_id: str, data: dict[str, Any]) -> None:
         write_yaml(self.project_dir(project_id) / "project.yaml", data)
 
-    def read_checklist(self, project_id: str) -> dict[str, Any] | None:
+    def _cached_checklist(self, project_id: str) -> tuple[dict[str, Any], dict[str, int]] | None:
         path = self.project_dir(project_id) / "checklist.yaml"
-        if not path.exists():
+        try:
+            stamp = _file_stamp(path)
+        except FileNotFoundError:
             return None
-        return read_yaml(path)
+        key = str(path)
+        with _CHECKLIST_CACHE_LOCK:
+            cached = _CHECKLIST_CACHE.get(key)
+            if cached and cached[0] == stamp:
+                _CHECKLIST_CACHE.move_to_end(key)
+                return cached[1], cached[2]
+        return _cache_checklist(key, stamp, read_yaml(path))
+
+    def read_checklist(self, project_id: str) -> dict[str, Any] | None:
+        cached = self._cached_checklist(project_id)
+        if cached is None:
+            return None
+        return copy.deepcopy(cached[0])
+
+    def read_checklist_indexed(self, project_id: str) -> tuple[dict[str, Any] | None, dict[str, int]]:
+        # The item_id -> position index is returned alongside the document, never stored in it,
+        # so API responses and exports keep the on-disk shape. Treat the index as read-only.
+        cached = self._cached_checklist(project_id)
+        if cached is None:
+            return None, {}
+        return copy.deepcopy(cached[0]), cached[1]
+
+    def _write_checklist_file(self, path: Path, data: dict[str, Any]) -> None:
+        write_yaml(path, data)
+        # The caller keeps `data`, so cache a private copy.
+        _cache_checklist(str(path), _file_stamp(path), copy.deepcopy(data))
 
     def write_checklist(self, project_id: str, data: dict[str, Any]) -> None:
-        write_yaml(self.project_dir(project_id) / "checklist.yaml", data)
+        self._write_checklist_file(self.project_dir(project_id) / "checklist.yaml", data)
 
     def delete_project(self, project_id: str) -> bool:
         proj_dir = self.project_dir(project_id)
         if not proj_dir.exists() or not proj_dir.is_dir():
             return False
         shutil.rmtree(proj_dir)
+        with _CHECKLIST_CACHE_LOCK:
+            _CHECKLIST_CACHE.pop(str(proj_dir / "checklist.yaml"), None)
         return True
 
     def audit_path(self, project_id: str) -> Path:
         return self.project_dir(project_id) / "auditlog.ndjson"
 
-    def append_audit(self, project_id: str, event_type: str, actor: str, details: dict[str, Any]) -> None:
-        append_event(self.audit_path(project_id), AuditEvent(event_type=event_type, actor=actor, details=details))
-
-    def save_evidence_file(self, project_id: str, item_id: str, filename: str, content: bytes) -> dict[str, Any]:
+    def write_bundle(
+        self,
+        project_id: str,
+        project: dict[str, Any],
+        checklist: dict[str, Any] | None,
+        audit: AuditEvent,
+    ) -> None:
+        # One mutation = project doc + optional checklist + audit line. The lock only stops two
+        # bundles for the same project from writing at the same time; it does not cover the
+        # caller's read-modify step, so concurrent PATCHes can still lose updates (last writer wins).
+        proj_dir = self.project_dir(project_id)
+        with _project_lock(project_id):
+            write_yaml(proj_dir / "project.yaml", project)
+            if checklist is not None:
+                self._write_checklist_file(proj_dir / "checklist.yaml", checklist)
+            append_event(self.audit_path(project_id), audit)
+
+    async def save_evidence_stream(self, project_id: str, item_id: str, filename: str, reader: Any, chunk_size: int = 1024 * 1024) -> dict[str, Any]:
+        # `reader` is anything with an awaitable read(n) (e.g. FastAPI's UploadFile). The upload is
+        # copied chunk by chunk and hashed on the way through, so memory stays at one chunk.
         proj_dir = self.project_dir(project_id)
         evidence_dir = proj_dir / "evidence" / item_id
         evidence_dir.mkdir(parents=True, exist_ok=True)
@@ -91,10 +172,20 @@ class FileSystemStorage:
                     target = candidate
                     break
                 i += 1
-        target.write_bytes(content)
+        h = hashlib.sha256()
+        size = 0
+        try:
+            with target.open("wb") as f:
+                while chunk := await reader.read(chunk_size):
+                    f.write(chunk)
+                    h.update(chunk)
+                    size += len(chunk)
+        except BaseException:
+            target.unlink(missing_ok=True)
+            raise
         return {
             "file_name": target.name,
             "relative_path": str(target.relative_to(proj_dir)),
-            "sha256": sha256_file(target),
-            "bytes": len(content),
+            "sha256": h.hexdigest(),
+            "bytes": size,
         }